@@ -0,0 +1,90 @@
+import asyncio
+
+from src.orchestrator.engine import Orchestrator
+
+
+class QueryBatcher:
+    """
+    Micro-batches queries for the event loop.
+
+    Requests are queued and a background task drains up to `max_batch` of
+    them (or whatever arrives within `max_wait` seconds of the first), then
+    runs them in a worker thread via `Orchestrator.batch_execute`.
+    """
+
+    def __init__(
+        self, orchestrator: Orchestrator, max_batch: int = 32, max_wait: float = 0.05
+    ):
+        self.orchestrator = orchestrator
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        # The batch taken off the queue but not yet answered
+        self._in_flight: list[tuple[str, asyncio.Future]] = []
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # Callers waiting on the interrupted batch or still queued would
+        # otherwise never resolve
+        for _, future in self._in_flight:
+            future.cancel()
+        self._in_flight = []
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+    async def submit(self, query: str) -> dict:
+        """
+        Execute a query as part of the next batch.
+        """
+        if self._task is None:
+            # Not started (e.g. no lifespan): execute directly off the loop
+            return await asyncio.to_thread(self.orchestrator.execute, query)
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((query, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = self._in_flight = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            queries = [query for query, _ in batch]
+            try:
+                results = await asyncio.to_thread(
+                    self.orchestrator.batch_execute, queries, return_exceptions=True
+                )
+            except Exception as e:
+                results = [e] * len(batch)
+
+            for (_, future), result in zip(batch, results):
+                if future.done():  # Caller went away
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+            self._in_flight = []
@@ -1,4 +1,4 @@
-from typing import Any, List, Optional
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -10,8 +10,10 @@ class QueryRequest(BaseModel):
 
 
 class RegimeResponse(BaseModel):
-    regime: List[int]
+    # Binary for logic-gate blueprints, but AVERAGE yields fractions and a
+    # cross-sectional SUM yields counts
+    regime: List[float]
     blueprint: dict
     provenance: str
     iterations: Optional[int] = None
-    initial_regime: Optional[List[int]] = None
+    initial_regime: Optional[List[float]] = None
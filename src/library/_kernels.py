@@ -0,0 +1,193 @@
+import numpy as np
+from numba import njit
+
+# Value-preserving fastmath only: no reassociation/reciprocal tricks, so the
+# fused kernels reproduce the standalone indicators bit for bit.
+_FASTMATH = {"nnan", "ninf", "nsz"}
+
+
+@njit(inline="always")
+def _rma(avg: float, x: float, period: int) -> float:
+    """
+    Wilder's running moving average update.
+    """
+    return (avg * (period - 1) + x) / period
+
+
+@njit(inline="always")
+def _wilder_step(i, d, period, avg_gain, avg_loss):
+    """
+    Advance Wilder's gain/loss averages by the i-th price delta `d`.
+    The first `period` deltas are summed and then seeded as a plain mean.
+    """
+    g = max(d, 0.0)
+    l = max(-d, 0.0)
+    if i < period:
+        return avg_gain + g, avg_loss + l
+    if i == period:
+        return (avg_gain + g) / period, (avg_loss + l) / period
+    return _rma(avg_gain, g, period), _rma(avg_loss, l, period)
+
+
+@njit(inline="always")
+def _rsi(avg_gain: float, avg_loss: float) -> float:
+    """
+    RSI from Wilder-smoothed gains/losses. Flat windows read as neutral (50).
+    """
+    if avg_loss == 0.0:
+        return 100.0 if avg_gain > 0.0 else 50.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit(inline="always")
+def _sma_at(c, i, window):
+    """
+    SMA of the full window ending at index i (i >= window - 1) from a
+    `prefix_sum` array, computed exactly as `rolling_mean` does.
+    """
+    return (c[i + 1] - c[i + 1 - window]) / window
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def rsi_regime(prices, period, lo, hi, out_ob, out_os):
+    """
+    Single-pass Wilder RSI writing both threshold regimes.
+
+    The warm-up slots before the first `period` deltas are left at 0
+    (neutral RSI).
+    """
+    n = prices.shape[0]
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    out_ob[0] = 0
+    out_os[0] = 0
+    for i in range(1, n):
+        avg_gain, avg_loss = _wilder_step(
+            i, prices[i] - prices[i - 1], period, avg_gain, avg_loss
+        )
+        if i < period:
+            out_ob[i] = 0
+            out_os[i] = 0
+            continue
+
+        rsi = _rsi(avg_gain, avg_loss)
+        out_ob[i] = rsi > hi
+        out_os[i] = rsi < lo
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def rsi_overbought_or_oversold_regime(prices, period_ob, hi, period_os, lo, out):
+    """
+    Fused `rsi_overbought OR rsi_oversold`, each with its own period.
+    """
+    n = prices.shape[0]
+    gain_ob = loss_ob = gain_os = loss_os = 0.0
+
+    out[0] = 0
+    for i in range(1, n):
+        d = prices[i] - prices[i - 1]
+        gain_ob, loss_ob = _wilder_step(i, d, period_ob, gain_ob, loss_ob)
+        gain_os, loss_os = _wilder_step(i, d, period_os, gain_os, loss_os)
+
+        overbought = i >= period_ob and _rsi(gain_ob, loss_ob) > hi
+        oversold = i >= period_os and _rsi(gain_os, loss_os) < lo
+        out[i] = overbought or oversold
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH)
+def sma_crossover_and_rsi_oversold_regime(
+    prices, c, short_window, long_window, period, lo, out
+):
+    """
+    Fused `sma_crossover AND rsi_oversold`; `c` is `prefix_sum(prices)`.
+    """
+    n = prices.shape[0]
+    warmup = max(short_window, long_window) - 1
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    out[0] = 0
+    for i in range(1, n):
+        avg_gain, avg_loss = _wilder_step(
+            i, prices[i] - prices[i - 1], period, avg_gain, avg_loss
+        )
+        if i < period or i < warmup:
+            out[i] = 0
+            continue
+
+        crossed = _sma_at(c, i, short_window) > _sma_at(c, i, long_window)
+        out[i] = crossed and _rsi(avg_gain, avg_loss) < lo
+
+
+def prefix_sum(prices: np.ndarray) -> np.ndarray:
+    """
+    Cumulative sum with a leading 0, so window sums are `c[j] - c[j - w]`.
+    """
+    c = np.empty(len(prices) + 1)
+    c[0] = 0.0
+    np.cumsum(prices, out=c[1:])
+    return c
+
+
+def rolling_mean(c: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling mean over the full windows only, i.e. length `len(c) - window`,
+    from a `prefix_sum` array. Entry k is the window ending at index
+    k + window - 1; there are no NaNs to fill.
+    """
+    return (c[window:] - c[:-window]) / window
+
+
+def rolling_count(mask: np.ndarray, window: int) -> np.ndarray:
+    """
+    Number of set entries of `mask` in each full window, aligned like
+    `rolling_mean`.
+    """
+    c = prefix_sum(mask)
+    return c[window:] - c[:-window]
+
+
+# Windows per block in `rolling_mean_std`, each block with its own shift
+_STD_BLOCK = 1024
+
+
+def rolling_mean_std(x: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling mean and sample std (ddof=1) over the full windows only, i.e.
+    length `len(x) - window + 1`, from prefix sums of x and x².
+    To limit cancellation in E[x²] - E[x]², each block of windows is shifted
+    by its first finite value (variance is shift invariant), so precision
+    does not decay as a long series drifts away from its start.
+    As with pandas, windows holding a non-finite value are NaN; the value is
+    zeroed before the prefix sums so it does not leak into later windows.
+    """
+    n_out = len(x) - window + 1
+    bad = ~np.isfinite(x)
+    has_bad = bad.any()
+
+    mean = np.empty(n_out)
+    var = np.empty(n_out)
+    for start in range(0, n_out, _STD_BLOCK):
+        stop = min(start + _STD_BLOCK, n_out)
+        seg = x[start : stop + window - 1]
+        finite = seg[~bad[start : stop + window - 1]] if has_bad else seg
+        anchor = finite[0] if len(finite) else 0.0
+
+        d = seg - anchor
+        if has_bad:
+            d[bad[start : stop + window - 1]] = 0.0
+        c = prefix_sum(d)
+        c2 = prefix_sum(d * d)
+        s = c[window:] - c[:-window]
+        s2 = c2[window:] - c2[:-window]
+
+        mean[start:stop] = s / window + anchor
+        var[start:stop] = (s2 - s * s / window) / (window - 1)
+
+    std = np.sqrt(np.maximum(var, 0.0))
+    if has_bad:
+        invalid = rolling_count(bad, window) > 0
+        mean[invalid] = np.nan
+        std[invalid] = np.nan
+    return mean, std
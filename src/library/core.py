@@ -7,7 +7,7 @@ class RegimeFunction(Protocol):
     
     Contract:
     - Input: 1D array of prices (float)
-    - Output: 1D array of binary states (int) {0, 1} of the same length
+    - Output: 1D array of binary states (uint8) {0, 1} of the same length
     """
     def __call__(self, prices: np.ndarray) -> np.ndarray:
         ...
@@ -20,9 +20,10 @@ def validate_input(prices: np.ndarray) -> None:
         raise TypeError("Input must be a numpy array")
     if prices.ndim != 1:
         raise ValueError("Input must be a 1D array")
-    if not np.issubdtype(prices.dtype, np.floating) and not np.issubdtype(prices.dtype, np.integer):
+    if prices.dtype.kind not in "fiu":
         raise TypeError("Input array must contain numeric values")
-    if np.any(np.isnan(prices)) or np.any(np.isinf(prices)):
+    # Single pass covers both NaN and Inf
+    if not np.isfinite(prices).all():
         raise ValueError("Input array contains NaN or Inf values")
     if len(prices) < 2:
         raise ValueError("Input array must have at least 2 data points")
@@ -37,5 +38,9 @@ def validate_output(result: np.ndarray, input_len: int) -> None:
         raise ValueError("Output must be a 1D array")
     if len(result) != input_len:
         raise ValueError(f"Output length ({len(result)}) does not match input length ({input_len})")
-    if not np.all(np.isin(result, [0, 1])):
+    if result.dtype == np.uint8:
+        is_binary = result.size == 0 or result.max() <= 1
+    else:
+        is_binary = np.all(np.isin(result, [0, 1]))
+    if not is_binary:
         raise ValueError("Output must contain only binary values (0 or 1)")
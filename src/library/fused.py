@@ -0,0 +1,99 @@
+import inspect
+
+import numpy as np
+
+from src.library._kernels import (
+    prefix_sum,
+    rsi_overbought_or_oversold_regime,
+    sma_crossover_and_rsi_oversold_regime,
+)
+from src.library.core import validate_input, validate_output
+from src.library.momentum import rsi_overbought, rsi_oversold
+from src.library.trend import sma_crossover
+
+
+def _defaults(func) -> dict:
+    return {
+        name: param.default
+        for name, param in inspect.signature(func).parameters.items()
+        if param.default is not param.empty
+    }
+
+
+# Keyword defaults of every fusable step, resolved once at import
+_DEFAULTS = {
+    func.__name__: _defaults(func)
+    for func in (rsi_overbought, rsi_oversold, sma_crossover)
+}
+
+
+def _bind(func, args: dict) -> dict:
+    """
+    Resolve blueprint args against a library function's defaults.
+    Raises TypeError on unknown args, as calling the function would.
+    """
+    defaults = _DEFAULTS[func.__name__]
+    unknown = args.keys() - defaults.keys()
+    if unknown:
+        raise TypeError(
+            f"{func.__name__}() got unexpected keyword arguments: {sorted(unknown)}"
+        )
+    return {**defaults, **args}
+
+
+def rsi_overbought_or_oversold(
+    prices: np.ndarray, overbought_args: dict, oversold_args: dict
+) -> np.ndarray:
+    """
+    Fused `rsi_overbought OR rsi_oversold` in a single pass.
+    """
+    validate_input(prices)
+    ob = _bind(rsi_overbought, overbought_args)
+    os = _bind(rsi_oversold, oversold_args)
+
+    regime = np.empty(len(prices), dtype=np.uint8)
+    rsi_overbought_or_oversold_regime(
+        np.ascontiguousarray(prices, dtype=np.float64),
+        int(ob["period"]),
+        float(ob["threshold"]),
+        int(os["period"]),
+        float(os["threshold"]),
+        regime,
+    )
+
+    validate_output(regime, len(prices))
+    return regime
+
+
+def sma_crossover_and_rsi_oversold(
+    prices: np.ndarray, crossover_args: dict, oversold_args: dict
+) -> np.ndarray:
+    """
+    Fused `sma_crossover AND rsi_oversold` in a single pass.
+    """
+    validate_input(prices)
+    cross = _bind(sma_crossover, crossover_args)
+    os = _bind(rsi_oversold, oversold_args)
+
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    regime = np.empty(len(prices), dtype=np.uint8)
+    sma_crossover_and_rsi_oversold_regime(
+        prices,
+        prefix_sum(prices),
+        int(cross["short_window"]),
+        int(cross["long_window"]),
+        int(os["period"]),
+        float(os["threshold"]),
+        regime,
+    )
+
+    validate_output(regime, len(prices))
+    return regime
+
+
+# (step function names, composition) -> fused implementation taking
+# (prices, *step_args). Only the blueprints the router emits most often.
+FUSED_BLUEPRINTS = {
+    (("rsi_overbought", "rsi_oversold"), "OR"): rsi_overbought_or_oversold,
+    (("sma_crossover", "rsi_oversold"), "AND"): sma_crossover_and_rsi_oversold,
+}
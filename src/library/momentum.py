@@ -1,20 +1,22 @@
 import numpy as np
-import pandas as pd
 
+from src.library._kernels import rsi_regime
 from src.library.core import validate_input, validate_output
 
 
-def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
+def calculate_rsi_regimes(
+    prices: np.ndarray, period: int = 14, lo: float = 30, hi: float = 70
+) -> tuple[np.ndarray, np.ndarray]:
     """
-    Helper to calculate RSI.
+    Helper to calculate the (overbought, oversold) RSI regimes in one pass.
+    Uses Wilder's smoothing (RMA); the warm-up period is neutral (0, 0).
     """
-    delta = prices.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi.fillna(50)  # Neutral RSI at start
+    # Fixed argument types so the kernel is only ever compiled once.
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
+    overbought = np.empty(len(prices), dtype=np.uint8)
+    oversold = np.empty(len(prices), dtype=np.uint8)
+    rsi_regime(prices, int(period), float(lo), float(hi), overbought, oversold)
+    return overbought, oversold
 
 
 def rsi_overbought(
@@ -26,11 +28,10 @@ def rsi_overbought(
     """
     validate_input(prices)
 
-    rsi = calculate_rsi(pd.Series(prices), period)
-    regime = np.where(rsi > threshold, 1, 0)
+    regime, _ = calculate_rsi_regimes(prices, period, hi=threshold)
 
     validate_output(regime, len(prices))
-    return regime.astype(int)
+    return regime
 
 
 def rsi_oversold(
@@ -42,8 +43,7 @@ def rsi_oversold(
     """
     validate_input(prices)
 
-    rsi = calculate_rsi(pd.Series(prices), period)
-    regime = np.where(rsi < threshold, 1, 0)
+    _, regime = calculate_rsi_regimes(prices, period, lo=threshold)
 
     validate_output(regime, len(prices))
-    return regime.astype(int)
+    return regime
@@ -1,6 +1,6 @@
 import numpy as np
-import pandas as pd
 
+from src.library._kernels import prefix_sum, rolling_mean
 from src.library.core import validate_input, validate_output
 
 
@@ -13,18 +13,20 @@ def sma_crossover(
     """
     validate_input(prices)
 
-    series = pd.Series(prices)
-    short_sma = series.rolling(window=short_window).mean()
-    long_sma = series.rolling(window=long_window).mean()
+    # 0 until both SMAs are defined
+    warmup = max(short_window, long_window) - 1
+    regime = np.empty(len(prices), dtype=np.uint8)
+    regime[:warmup] = 0
 
-    # Fill NaN values with initial price or 0 to maintain shape and avoid comparison issues
-    short_sma = short_sma.bfill().fillna(0)
-    long_sma = long_sma.bfill().fillna(0)
-
-    regime = np.where(short_sma > long_sma, 1, 0)
+    if warmup < len(prices):
+        # Both windows share one cumulative sum
+        c = prefix_sum(prices)
+        short_sma = rolling_mean(c, short_window)[warmup - short_window + 1 :]
+        long_sma = rolling_mean(c, long_window)[warmup - long_window + 1 :]
+        np.greater(short_sma, long_sma, out=regime[warmup:])
 
     validate_output(regime, len(prices))
-    return regime.astype(int)
+    return regime
 
 
 def price_above_sma(prices: np.ndarray, window: int = 50) -> np.ndarray:
@@ -34,11 +36,13 @@ def price_above_sma(prices: np.ndarray, window: int = 50) -> np.ndarray:
     """
     validate_input(prices)
 
-    series = pd.Series(prices)
-    sma = series.rolling(window=window).mean()
-    sma = sma.bfill().fillna(0)
+    # 0 until the SMA is defined
+    regime = np.empty(len(prices), dtype=np.uint8)
+    regime[: window - 1] = 0
 
-    regime = np.where(series > sma, 1, 0)
+    if window <= len(prices):
+        sma = rolling_mean(prefix_sum(prices), window)
+        np.greater(prices[window - 1 :], sma, out=regime[window - 1 :])
 
     validate_output(regime, len(prices))
-    return regime.astype(int)
+    return regime
@@ -1,6 +1,11 @@
 import numpy as np
-import pandas as pd
 
+from src.library._kernels import (
+    prefix_sum,
+    rolling_count,
+    rolling_mean,
+    rolling_mean_std,
+)
 from src.library.core import validate_input, validate_output
 
 
@@ -16,20 +21,17 @@ def bollinger_squeeze(
     """
     validate_input(prices)
 
-    series = pd.Series(prices)
-    sma = series.rolling(window=window).mean()
-    std = series.rolling(window=window).std()
+    bandwidth = np.ones(len(prices))  # Avoid false positives at start
+    if 2 <= window <= len(prices):
+        sma, std = rolling_mean_std(prices, window)
+        # (upper_band - lower_band) / sma
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bandwidth[window - 1 :] = (2 * num_std * std) / sma
 
-    upper_band = sma + (std * num_std)
-    lower_band = sma - (std * num_std)
-
-    bandwidth = (upper_band - lower_band) / sma
-    bandwidth = bandwidth.fillna(1.0)  # Avoid false positives at start
-
-    regime = np.where(bandwidth < squeeze_threshold, 1, 0)
+    regime = (bandwidth < squeeze_threshold).view(np.uint8)
 
     validate_output(regime, len(prices))
-    return regime.astype(int)
+    return regime
 
 
 def atr_expansion(prices: np.ndarray, window: int = 14) -> np.ndarray:
@@ -40,15 +42,27 @@ def atr_expansion(prices: np.ndarray, window: int = 14) -> np.ndarray:
     """
     validate_input(prices)
 
-    series = pd.Series(prices)
-    # Using rolling std dev as proxy for ATR since we only have close prices
-    volatility = series.pct_change().rolling(window=window).std()
-    volatility_sma = volatility.rolling(window=window * 2).mean()
+    n = len(prices)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.diff(prices) / prices[:-1]  # pct_change from t = 1
 
-    volatility = volatility.fillna(0)
-    volatility_sma = volatility_sma.fillna(0)
+    # Using rolling std dev as proxy for ATR since we only have close prices.
+    # The first full window of returns ends at index `window`; both series
+    # read 0 until they are defined, and wherever a window spans a non-finite
+    # return (a zero price), as pandas' fillna(0) did.
+    volatility = np.zeros(n)
+    volatility_sma = np.zeros(n)
+    sma_window = window * 2
+    if 2 <= window < n:
+        std = rolling_mean_std(returns, window)[1]
+        if sma_window <= len(std):
+            missing = np.isnan(std)
+            sma = rolling_mean(prefix_sum(np.where(missing, 0.0, std)), sma_window)
+            sma[rolling_count(missing, sma_window) > 0] = 0.0
+            volatility_sma[window + sma_window - 1 :] = sma
+        volatility[window:] = np.nan_to_num(std, nan=0.0)
 
-    regime = np.where(volatility > volatility_sma, 1, 0)
+    regime = (volatility > volatility_sma).view(np.uint8)
 
     validate_output(regime, len(prices))
-    return regime.astype(int)
+    return regime
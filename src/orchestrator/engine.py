@@ -1,11 +1,19 @@
+import threading
+from collections import OrderedDict, deque
+
 import numpy as np
 
+from src.library.fused import FUSED_BLUEPRINTS
 from src.library.momentum import rsi_overbought, rsi_oversold
 from src.library.trend import price_above_sma, sma_crossover
 from src.library.volatility import atr_expansion, bollinger_squeeze
 from src.orchestrator.hooks import LifecycleHooks
-from src.orchestrator.stability import calculate_hamming_distance, check_stability
-from src.router.interface import ExecutionBlueprint, SemanticRouter
+from src.orchestrator.stability import (
+    calculate_hamming_distance,
+    check_stability,
+    pack_bits,
+)
+from src.router.interface import ExecutionBlueprint, Kernel, SemanticRouter
 from src.utils.data_loader import load_data
 from src.utils.smoothing import smooth_regime
 
@@ -15,71 +23,120 @@ class Orchestrator:
     Kernel-Mode Orchestrator: Coordinates execution of frozen functions.
     """
 
-    def __init__(self, router: SemanticRouter):
+    def __init__(self, router: SemanticRouter, cache_size: int = 1024):
         self.router = router
-        self.registry = {
-            "sma_crossover": sma_crossover,
-            "price_above_sma": price_above_sma,
-            "bollinger_squeeze": bollinger_squeeze,
-            "atr_expansion": atr_expansion,
-            "rsi_overbought": rsi_overbought,
-            "rsi_oversold": rsi_oversold,
+        # Indexed by Kernel, in enum order
+        self._fn_table = (
+            sma_crossover,
+            price_above_sma,
+            bollinger_squeeze,
+            atr_expansion,
+            rsi_overbought,
+            rsi_oversold,
+        )
+        # Composition gates, each a single C-level ufunc reduction
+        self._composers = {
+            "AND": lambda results: np.logical_and.reduce(results).view(np.uint8),
+            "OR": lambda results: np.logical_or.reduce(results).view(np.uint8),
+            "XOR": lambda results: np.logical_xor.reduce(results).view(np.uint8),
+            # Average is tricky for binary arrays, returns float probability
+            "AVERAGE": lambda results: np.mean(results, axis=0),
+            # Widen so counts are not bounded by the uint8 regimes
+            "SUM": lambda results: np.add.reduce(results, dtype=int),
+        }
+        # Single-pass kernels for common multi-step blueprints
+        self._fused = {
+            (tuple(Kernel[name.upper()] for name in names), composition): fused
+            for (names, composition), fused in FUSED_BLUEPRINTS.items()
         }
+        # LRU of (read-only regime, blueprint) per query. Valid because routing
+        # and data are deterministic.
+        self._exec_cache: OrderedDict[
+            str, tuple[np.ndarray, ExecutionBlueprint]
+        ] = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
 
     def execute(self, query: str) -> dict:
         """
         Main entry point: Parse intent -> Generate Blueprint -> Execute.
+        Results are memoised per query (see `cache_size`).
+        """
+        return self._to_result(*self._execute_native(query))
+
+    def batch_execute(
+        self, queries: list[str], return_exceptions: bool = False
+    ) -> list:
+        """
+        Execute a batch of queries, running each distinct query only once.
+        With `return_exceptions`, a failing query yields its exception in
+        place of a result instead of aborting the batch.
+        """
+        unique = {}
+        for query in dict.fromkeys(queries):
+            try:
+                unique[query] = self._execute_native(query)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                unique[query] = e
+
+        return [
+            r if isinstance(r, Exception) else self._to_result(*r)
+            for r in (unique[query] for query in queries)
+        ]
+
+    @staticmethod
+    def _to_result(regime: np.ndarray, blueprint: ExecutionBlueprint) -> dict:
+        """
+        Public result dict; the regime is copied so callers own it.
+        """
+        return {
+            "regime": regime.copy(),
+            "blueprint": blueprint.model_dump(),
+            "provenance": "Executed via Quant Library Orchestrator v1.1 (Multi-Asset)",
+        }
+
+    def _execute_native(self, query: str) -> tuple[np.ndarray, ExecutionBlueprint]:
+        """
+        Cached execution returning the raw (regime, blueprint).
+        The regime is shared with the cache and therefore read-only.
+        """
+        key = query.strip()
+        with self._cache_lock:
+            cached = self._exec_cache.get(key)
+            if cached is not None:
+                self._exec_cache.move_to_end(key)
+                return cached
+
+        regime, blueprint = self._execute(query)
+        regime.flags.writeable = False
+
+        if self._cache_size > 0:
+            with self._cache_lock:
+                self._exec_cache[key] = (regime, blueprint)
+                while len(self._exec_cache) > self._cache_size:
+                    self._exec_cache.popitem(last=False)
+        return regime, blueprint
+
+    def _execute(self, query: str) -> tuple[np.ndarray, ExecutionBlueprint]:
+        """
+        Uncached execution.
         Support for Multi-Asset Cross-Sectional Execution and Synthetic Positions.
         """
         blueprint = self.router.parse_intent(query)
         assets = blueprint.assets if blueprint.assets else ["BTC"]
 
-        # 1. Resolve Data (Synthetic or Direct)
-        # If asset is "A-B", we compute difference.
-        # For simplicity, if ANY asset string contains arithmetic, we treat it as synthetic.
-        # Real implementation would have a robust parser.
-        final_results = []
-
-        for asset in assets:
-            if "-" in asset and " " not in asset:  # Simple A-B check
-                parts = asset.split("-")
-                p1 = load_data(parts[0], limit=100)
-                p2 = load_data(parts[1], limit=100)
-                prices = p1 - p2  # Synthetic Position
-            else:
-                prices = load_data(asset, limit=100)
-
-            asset_results = []
-            for step in blueprint.steps:
-                func = self.registry.get(step.function_name)
-                if not func:
-                    raise ValueError(
-                        f"Function {step.function_name} not found in registry"
-                    )
-
-                LifecycleHooks.pre_tool_use(step.function_name, step.args, prices)
-                try:
-                    res = func(prices, **step.args)
-                except Exception as e:
-                    raise RuntimeError(
-                        f"Execution failed for {step.function_name}: {e}"
-                    )
-                LifecycleHooks.post_tool_use(step.function_name, res, len(prices))
-                asset_results.append(res)
-
-            # Compose per asset (Vertical Composition)
-            # If multiple steps, we verify how to combine them.
-            # Usually strict pipeline implies sequential or composed signal.
-            # Here we assume the blueprint composition applies to the Steps *Result*.
-            # But wait, blueprint.composition is for combining the final results?
-            # Let's clarify: Blueprint steps -> [Result1, Result2].
-            # Compose -> Final Result for Asset A.
-
-            # If we have multiple assets, we might want to return per-asset OR aggregated.
-            # "Cross-sectional sum" implies aggregating across assets.
-
-            per_asset_regime = self._compose(asset_results, blueprint.composition)
-            final_results.append(per_asset_regime)
+        fused = self._fused.get(
+            (tuple(step.function_id for step in blueprint.steps), blueprint.composition)
+        )
+
+        # 1. Per-asset pipelines, run serially: at the loader's N=100 each one
+        # is mostly Python and NumPy call overhead under the GIL, so a thread
+        # pool would only add hand-off cost.
+        final_results = [
+            self._run_single_asset(asset, blueprint, fused) for asset in assets
+        ]
 
         # 2. Cross-Sectional Aggregation (if multiple assets)
         # If > 1 asset, we need a specific aggregation strategy.
@@ -96,11 +153,70 @@ class Orchestrator:
         else:
             final_regime = final_results[0]
 
-        return {
-            "regime": final_regime.tolist(),
-            "blueprint": blueprint.model_dump(),
-            "provenance": "Executed via Quant Library Orchestrator v1.1 (Multi-Asset)",
-        }
+        return final_regime, blueprint
+
+    def _run_single_asset(
+        self, asset: str, blueprint: ExecutionBlueprint, fused=None
+    ) -> np.ndarray:
+        """
+        Load one asset's prices and run the blueprint steps + composition on them.
+        """
+        # Resolve Data (Synthetic or Direct)
+        # If asset is "A-B", we compute difference.
+        # For simplicity, if ANY asset string contains arithmetic, we treat it as synthetic.
+        # Real implementation would have a robust parser.
+        if "-" in asset and " " not in asset:  # Simple A-B check
+            parts = asset.split("-")
+            p1 = load_data(parts[0], limit=100)
+            p2 = load_data(parts[1], limit=100)
+            prices = p1 - p2  # Synthetic Position
+        else:
+            prices = load_data(asset, limit=100)
+
+        # Every step reads the same series, so validate it once here
+        LifecycleHooks.pre_data_use(asset, prices)
+
+        if fused is not None:
+            return self._execute_fused(fused, blueprint, prices)
+
+        asset_results = []
+        for step in blueprint.steps:
+            func = self._fn_table[step.function_id]
+            name = step.function_id.function_name
+
+            LifecycleHooks.pre_tool_use(name, step.args)
+            try:
+                res = func(prices, **step.args)
+            except Exception as e:
+                raise RuntimeError(f"Execution failed for {name}: {e}")
+            LifecycleHooks.post_tool_use(name, res, len(prices))
+            asset_results.append(res)
+
+        # Compose per asset (Vertical Composition)
+        # If multiple steps, we verify how to combine them.
+        # Usually strict pipeline implies sequential or composed signal.
+        # Here we assume the blueprint composition applies to the Steps *Result*.
+        # Let's clarify: Blueprint steps -> [Result1, Result2].
+        # Compose -> Final Result for Asset A.
+        # "Cross-sectional sum" across assets is handled by the caller.
+        return self._compose(asset_results, blueprint.composition)
+
+    def _execute_fused(
+        self, fused, blueprint: ExecutionBlueprint, prices: np.ndarray
+    ) -> np.ndarray:
+        """
+        Run a whole blueprint (steps + composition) as one fused kernel.
+        """
+        for step in blueprint.steps:
+            LifecycleHooks.pre_tool_use(step.function_id.function_name, step.args)
+
+        name = "+".join(step.function_id.function_name for step in blueprint.steps)
+        try:
+            res = fused(prices, *(step.args for step in blueprint.steps))
+        except Exception as e:
+            raise RuntimeError(f"Execution failed for {name}: {e}")
+        LifecycleHooks.post_tool_use(name, res, len(prices))
+        return res
 
     def _compose(self, results: list[np.ndarray], method: str) -> np.ndarray:
         """
@@ -112,58 +228,79 @@ class Orchestrator:
         if len(results) == 1:
             return results[0]
 
-        combined = results[0]
-        for i in range(1, len(results)):
-            next_res = results[i]
-
-            if method == "AND":
-                combined = np.logical_and(combined, next_res)
-            elif method == "OR":
-                combined = np.logical_or(combined, next_res)
-            elif method == "XOR":
-                combined = np.logical_xor(combined, next_res)
-            elif method == "AVERAGE":
-                # Average is tricky for binary arrays, returns float probability
-                # Just averaging 0s and 1s here
-                combined = (combined + next_res) / 2.0
-            elif method == "SUM":
-                combined = combined + next_res
-            else:
-                raise ValueError(f"Unknown composition method: {method}")
-
-        return combined.astype(int) if method != "AVERAGE" else combined
+        composer = self._composers.get(method)
+        if composer is None:
+            raise ValueError(f"Unknown composition method: {method}")
+        return composer(results)
 
     def run_until_stable(self, query: str, max_iterations: int = 10) -> dict:
         """
         Recursive Stability Loop.
         Executing query, then iteratively applying smoothing until stable.
         """
-        result = self.execute(query)
-        initial_regime = np.array(result["regime"])
+        # Native result: no copy or blueprint dump before the loop
+        initial_regime, blueprint = self._execute_native(query)
 
-        history = [initial_regime]
+        regime = initial_regime
+        # Smoothed regimes are always uint8, but an AVERAGE/SUM input is not
+        # binary and can't be packed; it is compared unpacked on the first pass
+        bits = pack_bits(regime) if regime.dtype == np.uint8 else None
+        # XOR scratch for the packed Hamming distance, reused every iteration
+        scratch = np.empty(-(-len(regime) // 64), dtype=np.uint64)
+        # Double buffer: each pass smooths the current regime into `back`,
+        # which then becomes current, so the loop allocates no new regimes
+        front = np.empty(len(regime), dtype=np.uint8)
+        back = np.empty(len(regime), dtype=np.uint8)
+        # Packed bytes of the last few binary regimes, for cycle detection
+        recent = deque(maxlen=4)
+        iterations = 0
+        oscillating = False
 
         for k in range(max_iterations):
-            prev_regime = history[-1]
-            next_regime = smooth_regime(prev_regime)
+            next_regime = smooth_regime(regime, out=back)
+            # Unchanged if too short to smooth, so it may still be non-binary
+            next_bits = (
+                pack_bits(next_regime) if next_regime.dtype == np.uint8 else None
+            )
 
             # Check stability
-            d_h = calculate_hamming_distance(prev_regime, next_regime)
-            is_stable = check_stability(d_h, len(prev_regime))
+            if bits is not None:
+                d_h = calculate_hamming_distance(bits, next_bits, out=scratch)
+                recent.append(bits.tobytes())
+            else:
+                d_h = calculate_hamming_distance(regime, next_regime)
+            is_stable = check_stability(d_h, len(regime))
 
-            history.append(next_regime)
+            regime, bits = next_regime, next_bits
+            front, back = back, front
+            iterations = k + 1
 
             # Stop Hook
-            if LifecycleHooks.stop_hook(k + 1, max_iterations, d_h):
+            if LifecycleHooks.stop_hook(iterations, max_iterations, d_h):
                 break
 
             if is_stable:
                 break
 
+            # Circuit breaker: a regime seen a few passes ago is a cycle the
+            # Hamming check would never settle
+            if bits.tobytes() in recent:
+                oscillating = True
+                break
+
+        if oscillating:
+            provenance = (
+                "Recursive execution halted on an oscillating regime "
+                f"after {iterations} iterations"
+            )
+        else:
+            provenance = f"Recursive execution stable after {iterations} iterations"
+
+        # The initial regime is shared with the cache; copy so callers own it
         return {
-            "regime": history[-1].tolist(),
-            "iterations": len(history) - 1,
-            "initial_regime": initial_regime.tolist(),
-            "blueprint": result["blueprint"],
-            "provenance": f"Recursive execution stable after {len(history)-1} iterations",
+            "regime": regime.copy() if regime is initial_regime else regime,
+            "iterations": iterations,
+            "initial_regime": initial_regime.copy(),
+            "blueprint": blueprint.model_dump(),
+            "provenance": provenance,
         }
@@ -11,15 +11,25 @@ class LifecycleHooks:
     """
 
     @staticmethod
-    def pre_tool_use(func_name: str, args: dict, prices: np.ndarray) -> None:
+    def pre_data_use(asset: str, prices: np.ndarray) -> None:
         """
-        Intercept tool calls to validate input schema compliance.
+        Validate an asset's price series once, before any tool runs on it.
         """
         try:
             validate_input(prices)
-            # Add more specific validation here if needed
         except Exception as e:
-            raise ValueError(f"PreToolUse Hook Failed for {func_name}: {str(e)}")
+            raise ValueError(f"PreDataUse Hook Failed for {asset}: {str(e)}")
+
+    @staticmethod
+    def pre_tool_use(func_name: str, args: dict) -> None:
+        """
+        Intercept tool calls to validate input schema compliance.
+        Price data is validated per asset by `pre_data_use`.
+        """
+        if not isinstance(args, dict) or not all(isinstance(k, str) for k in args):
+            raise ValueError(
+                f"PreToolUse Hook Failed for {func_name}: args must map names to values"
+            )
 
     @staticmethod
     def post_tool_use(func_name: str, result: np.ndarray, input_len: int) -> None:
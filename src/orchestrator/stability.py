@@ -1,15 +1,60 @@
 import numpy as np
 
+if hasattr(np, "bitwise_count"):
 
-def calculate_hamming_distance(array1: np.ndarray, array2: np.ndarray) -> int:
+    def _count_bit_differences(
+        words1: np.ndarray, words2: np.ndarray, out: np.ndarray | None = None
+    ) -> int:
+        diff = np.bitwise_xor(words1, words2, out=out)
+        return int(np.bitwise_count(diff, out=diff).sum())
+
+else:  # NumPy < 2.0 has no popcount ufunc
+    from numba import njit
+
+    @njit(cache=True)
+    def _count_bits_kernel(words1, words2):
+        total = 0
+        for i in range(words1.shape[0]):
+            x = words1[i] ^ words2[i]
+            # SWAR popcount
+            x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+            x = (x & np.uint64(0x3333333333333333)) + (
+                (x >> np.uint64(2)) & np.uint64(0x3333333333333333)
+            )
+            x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+            total += (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+        return int(total)
+
+    def _count_bit_differences(words1, words2, out=None):
+        return _count_bits_kernel(words1, words2)
+
+
+def calculate_hamming_distance(
+    array1: np.ndarray, array2: np.ndarray, out: np.ndarray | None = None
+) -> int:
     """
     Calculate the Hamming distance between two binary arrays.
     Number of positions at which the corresponding symbols are different.
+    Bit-packed uint64 inputs (see `pack_bits`) are compared with XOR + popcount.
+    `out` is an optional scratch buffer of the inputs' length (uint64 for packed
+    inputs, uint8 otherwise) reused instead of allocating a temporary.
     """
     if len(array1) != len(array2):
         raise ValueError("Arrays must have the same length")
 
-    return np.count_nonzero(array1 != array2)
+    if array1.dtype == np.uint64 and array2.dtype == np.uint64:
+        return _count_bit_differences(array1, array2, out)
+    return np.count_nonzero(np.not_equal(array1, array2, out=out))
+
+
+def pack_bits(regime: np.ndarray) -> np.ndarray:
+    """
+    Pack a binary regime into uint64 words (1 bit per sample, zero padded).
+    """
+    packed = np.packbits(regime)
+    words = np.zeros(-(-len(packed) // 8) * 8, dtype=np.uint8)
+    words[: len(packed)] = packed
+    return words.view(np.uint64)
 
 
 def check_stability(d_h: int, input_len: int, threshold_pct: float = 0.01) -> bool:
@@ -1,6 +1,32 @@
-from typing import Any, Dict, List, Literal, Optional, Protocol
+from enum import IntEnum
+from typing import Any, Dict, List, Literal, Protocol
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_serializer,
+    field_validator,
+)
+
+
+class Kernel(IntEnum):
+    """
+    The closed set of frozen library functions a blueprint can call.
+    Values index the Orchestrator's function table.
+    """
+
+    SMA_CROSSOVER = 0
+    PRICE_ABOVE_SMA = 1
+    BOLLINGER_SQUEEZE = 2
+    ATR_EXPANSION = 3
+    RSI_OVERBOUGHT = 4
+    RSI_OVERSOLD = 5
+
+    @property
+    def function_name(self) -> str:
+        return self.name.lower()
 
 
 class FunctionCall(BaseModel):
@@ -8,10 +34,31 @@ class FunctionCall(BaseModel):
     Represents a single function call in the execution blueprint.
     """
 
-    function_name: str
+    # The wire format keeps the original "function_name" key, in and out
+    model_config = ConfigDict(serialize_by_alias=True)
+
+    function_id: Kernel = Field(
+        validation_alias=AliasChoices("function_id", "function_name"),
+        serialization_alias="function_name",
+    )
     args: Dict[str, Any] = Field(default_factory=dict)
     weight: float = 1.0  # For weighted combinations
 
+    @field_validator("function_id", mode="before")
+    @classmethod
+    def _parse_function_name(cls, value: Any) -> Any:
+        # Routers emitting JSON refer to functions by name
+        if isinstance(value, str):
+            try:
+                return Kernel[value.upper()]
+            except KeyError:
+                raise ValueError(f"Unknown function: {value}")
+        return value
+
+    @field_serializer("function_id")
+    def _serialize_function_id(self, function_id: Kernel) -> str:
+        return function_id.function_name
+
 
 class ExecutionBlueprint(BaseModel):
     """
@@ -1,6 +1,11 @@
 from typing import List
 
-from src.router.interface import ExecutionBlueprint, FunctionCall, SemanticRouter
+from src.router.interface import (
+    ExecutionBlueprint,
+    FunctionCall,
+    Kernel,
+    SemanticRouter,
+)
 
 
 class MockSemanticRouter(SemanticRouter):
@@ -15,7 +20,7 @@ class MockSemanticRouter(SemanticRouter):
             return ExecutionBlueprint(
                 steps=[
                     FunctionCall(
-                        function_name="sma_crossover",
+                        function_id=Kernel.SMA_CROSSOVER,
                         args={"short_window": 20, "long_window": 50},
                     )
                 ],
@@ -28,7 +33,7 @@ class MockSemanticRouter(SemanticRouter):
             return ExecutionBlueprint(
                 steps=[
                     FunctionCall(
-                        function_name="bollinger_squeeze",
+                        function_id=Kernel.BOLLINGER_SQUEEZE,
                         args={"window": 20, "num_std": 2.0},
                     )
                 ],
@@ -41,9 +46,11 @@ class MockSemanticRouter(SemanticRouter):
             return ExecutionBlueprint(
                 steps=[
                     FunctionCall(
-                        function_name="rsi_overbought", args={"threshold": 70}
+                        function_id=Kernel.RSI_OVERBOUGHT, args={"threshold": 70}
+                    ),
+                    FunctionCall(
+                        function_id=Kernel.RSI_OVERSOLD, args={"threshold": 30}
                     ),
-                    FunctionCall(function_name="rsi_oversold", args={"threshold": 30}),
                 ],
                 composition="OR",  # Trigger on either OB or OS
                 timeframe="1d",
@@ -53,8 +60,8 @@ class MockSemanticRouter(SemanticRouter):
         elif "combine" in query:
             return ExecutionBlueprint(
                 steps=[
-                    FunctionCall(function_name="sma_crossover"),
-                    FunctionCall(function_name="rsi_oversold"),
+                    FunctionCall(function_id=Kernel.SMA_CROSSOVER),
+                    FunctionCall(function_id=Kernel.RSI_OVERSOLD),
                 ],
                 composition="AND",
                 timeframe="1d",
@@ -64,7 +71,7 @@ class MockSemanticRouter(SemanticRouter):
         else:
             # Default fallback
             return ExecutionBlueprint(
-                steps=[FunctionCall(function_name="sma_crossover")],
+                steps=[FunctionCall(function_id=Kernel.SMA_CROSSOVER)],
                 composition="AND",
                 timeframe="1d",
                 assets=["BTC"],
@@ -1,15 +1,26 @@
+import functools
+
 import numpy as np
 import pandas as pd
 
 
+@functools.lru_cache(maxsize=256)
+def _load_cached(symbol: str, timeframe: str, limit: int) -> np.ndarray:
+    # Local generator with the same seed: deterministic without touching global state
+    rng = np.random.RandomState(42)
+
+    returns = rng.normal(0, 0.02, limit)
+    price = 100 * (1 + returns).cumprod()
+
+    # Shared between callers, so freeze it
+    price.flags.writeable = False
+    return price
+
+
 def load_data(symbol: str, timeframe: str = "1d", limit: int = 100) -> np.ndarray:
     """
     Mock data loader.
     Returns random walk data for testing.
+    Results are cached per (symbol, timeframe, limit) and read-only.
     """
-    np.random.seed(42)  # Deterministic for testing
-
-    returns = np.random.normal(0, 0.02, limit)
-    price = 100 * (1 + returns).cumprod()
-
-    return price
+    return _load_cached(symbol, timeframe, limit)
@@ -1,21 +1,46 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 
-def smooth_regime(regime: np.ndarray, window: int = 3) -> np.ndarray:
+def smooth_regime(
+    regime: np.ndarray, window: int = 3, out: np.ndarray | None = None
+) -> np.ndarray:
     """
     Simple majority voting smoothing to reduce noise.
+    Windows are centred and shrink at the edges of the series.
+    If given, the uint8 `out` buffer (which must not alias `regime`) receives
+    the result and is returned.
+    A regime shorter than the window is returned unchanged; it is copied into
+    `out` only if it is itself uint8.
     """
     if len(regime) < window:
-        return regime
+        if out is None or regime.dtype != np.uint8:
+            return regime
+        out[:] = regime
+        return out
 
-    result = np.copy(regime)
-    for i in range(len(regime)):
-        start = max(0, i - window // 2)
-        end = min(len(regime), i + window // 2 + 1)
-        # Majority vote
-        if np.sum(regime[start:end]) > (end - start) / 2:
-            result[i] = 1
+    n = len(regime)
+    half = window // 2
+    width = 2 * half + 1
+    result = np.empty(n, dtype=np.uint8) if out is None else out
+
+    # Interior: full centred windows
+    if n >= width:
+        interior = result[half : n - half]
+        if width == 3 and regime.dtype == np.uint8:
+            # Binary input: the 3-sum fits in uint8, so vote in place
+            np.add(regime[:-2], regime[1:-1], out=interior)
+            np.add(interior, regime[2:], out=interior)
+            np.greater(interior, 1, out=interior)
         else:
-            result[i] = 0
+            sums = sliding_window_view(regime, width).sum(axis=1)
+            np.greater(sums, width / 2, out=interior)
+
+    # Edges: truncated windows
+    for i in range(min(half, n)):
+        for j in (i, n - 1 - i):
+            start = max(0, j - half)
+            end = min(n, j + half + 1)
+            result[j] = np.sum(regime[start:end]) > (end - start) / 2
 
     return result
@@ -0,0 +1,80 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.batching import QueryBatcher
+from src.api.main import app, orchestrator
+
+
+def test_concurrent_queries_are_batched(monkeypatch):
+    queries = ["Show me the trend of BTC", "Show me momentum", "Show me squeeze"] * 4
+
+    batch_sizes = []
+    batch_execute = orchestrator.batch_execute
+
+    def spy(batch, **kwargs):
+        batch_sizes.append(len(batch))
+        return batch_execute(batch, **kwargs)
+
+    monkeypatch.setattr(orchestrator, "batch_execute", spy)
+
+    with TestClient(app) as client:
+        with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+            responses = list(
+                pool.map(lambda q: client.post("/query", json={"query": q}), queries)
+            )
+
+    assert all(r.status_code == 200 for r in responses)
+    assert all(len(r.json()["regime"]) == 100 for r in responses)
+    assert sum(batch_sizes) == len(queries)
+    assert max(batch_sizes) > 1
+
+
+def test_recursive_query():
+    with TestClient(app) as client:
+        response = client.post(
+            "/query",
+            json={"query": "Show me the trend of BTC", "recursive_stability": True},
+        )
+
+    assert response.status_code == 200
+    assert len(response.json()["initial_regime"]) == 100
+
+
+def test_stop_cancels_in_flight_batch():
+    started = threading.Event()
+    release = threading.Event()
+
+    class SlowOrchestrator:
+        def batch_execute(self, queries, return_exceptions=False):
+            started.set()
+            release.wait(5)
+            return [{} for _ in queries]
+
+    async def scenario():
+        batcher = QueryBatcher(SlowOrchestrator(), max_wait=0)
+        await batcher.start()
+        pending = asyncio.ensure_future(batcher.submit("Show me momentum"))
+        await asyncio.to_thread(started.wait, 5)
+
+        await batcher.stop()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(pending, 1)
+
+    asyncio.run(scenario())
+
+
+def test_query_schema_allows_non_binary_regimes():
+    with TestClient(app) as client:
+        schema = client.get("/openapi.json").json()
+
+    ok = schema["paths"]["/query"]["post"]["responses"]["200"]
+    assert ok["content"]["application/json"]["schema"]["$ref"].endswith(
+        "RegimeResponse"
+    )
+    regime = schema["components"]["schemas"]["RegimeResponse"]["properties"]["regime"]
+    assert regime["items"]["type"] == "number"
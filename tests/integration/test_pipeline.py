@@ -1,6 +1,14 @@
+import numpy as np
 import pytest
+from pydantic import ValidationError
 
 from src.orchestrator.engine import Orchestrator
+from src.router.interface import (
+    ExecutionBlueprint,
+    FunctionCall,
+    Kernel,
+    SemanticRouter,
+)
 from src.router.mock_router import MockSemanticRouter
 
 
@@ -29,3 +37,105 @@ def test_recursive_stability():
     assert "iterations" in result
     assert result["iterations"] >= 0
     assert len(result["regime"]) == 100
+
+
+def test_execute_cache_returns_independent_copies():
+    router = MockSemanticRouter()
+    orchestrator = Orchestrator(router, cache_size=1)
+
+    first = orchestrator.execute("Show me the trend of BTC")
+    first["regime"][0] = 7
+    second = orchestrator.execute("Show me the trend of BTC")
+    assert second["regime"][0] != 7
+
+    orchestrator.execute("Show me momentum")
+    assert len(orchestrator._exec_cache) == 1
+
+
+def test_recursive_stability_returns_writable_regimes():
+    orchestrator = Orchestrator(MockSemanticRouter())
+
+    for max_iterations in (0, 3):
+        result = orchestrator.run_until_stable(
+            "Show me the trend of BTC", max_iterations=max_iterations
+        )
+        result["regime"][0] = 7
+        result["initial_regime"][0] = 7
+
+    assert orchestrator.execute("Show me the trend of BTC")["regime"][0] != 7
+
+
+def test_batch_execute_deduplicates_queries():
+    router = MockSemanticRouter()
+    orchestrator = Orchestrator(router)
+
+    results = orchestrator.batch_execute(
+        ["Show me the trend of BTC", "Show me momentum", "Show me the trend of BTC"]
+    )
+    assert len(results) == 3
+    np.testing.assert_array_equal(results[0]["regime"], results[2]["regime"])
+    assert results[0]["regime"] is not results[2]["regime"]
+    assert results[1]["blueprint"]["composition"] == "OR"
+
+
+def test_recursive_stability_on_average_regime():
+    class AverageRouter(SemanticRouter):
+        def parse_intent(self, query: str) -> ExecutionBlueprint:
+            return ExecutionBlueprint(
+                steps=[
+                    FunctionCall(function_id=Kernel.SMA_CROSSOVER),
+                    FunctionCall(function_id=Kernel.PRICE_ABOVE_SMA),
+                ],
+                composition="AVERAGE",
+            )
+
+    result = Orchestrator(AverageRouter()).run_until_stable("average")
+    assert result["initial_regime"].dtype == np.float64
+    assert result["regime"].dtype == np.uint8
+    assert len(result["regime"]) == 100
+    assert result["iterations"] >= 1
+
+
+def test_recursive_stability_detects_oscillation(monkeypatch):
+    import src.orchestrator.engine as engine
+
+    # An inverting "smoother" flips every bit, so the Hamming check never settles
+    monkeypatch.setattr(
+        engine,
+        "smooth_regime",
+        lambda regime, out: np.subtract(1, regime, out=out, dtype=np.uint8),
+    )
+    orchestrator = Orchestrator(MockSemanticRouter())
+
+    result = orchestrator.run_until_stable("Show me the trend of BTC", max_iterations=10)
+    assert result["iterations"] == 2
+    assert "oscillating" in result["provenance"]
+
+
+def test_function_table_matches_kernel_enum():
+    orchestrator = Orchestrator(MockSemanticRouter())
+    assert len(orchestrator._fn_table) == len(Kernel)
+    for kernel in Kernel:
+        assert orchestrator._fn_table[kernel].__name__ == kernel.function_name
+
+
+def test_function_call_accepts_names():
+    call = FunctionCall(function_id="rsi_oversold", args={"threshold": 25})
+    assert call.function_id is Kernel.RSI_OVERSOLD
+    assert call.model_dump()["function_name"] == "rsi_oversold"
+    assert '"function_name":"rsi_oversold"' in call.model_dump_json()
+
+    with pytest.raises(ValidationError):
+        FunctionCall(function_id="not_a_function")
+
+
+def test_function_call_accepts_function_name_key():
+    blueprint = ExecutionBlueprint.model_validate_json(
+        '{"steps": [{"function_name": "rsi_oversold", "args": {"threshold": 25}}]}'
+    )
+    assert blueprint.steps[0].function_id is Kernel.RSI_OVERSOLD
+
+    result = Orchestrator(MockSemanticRouter()).execute("Show me momentum")
+    step = result["blueprint"]["steps"][0]
+    assert step["function_name"] == "rsi_overbought"
+    assert "function_id" not in step
@@ -1,6 +1,11 @@
 import numpy as np
 import pytest
 
+from src.library._kernels import rolling_mean_std
+from src.library.fused import (
+    rsi_overbought_or_oversold,
+    sma_crossover_and_rsi_oversold,
+)
 from src.library.momentum import rsi_overbought, rsi_oversold
 from src.library.trend import price_above_sma, sma_crossover
 from src.library.volatility import atr_expansion, bollinger_squeeze
@@ -40,3 +45,126 @@ def test_rsi_oversold():
     prices = np.array([100 * (0.9**i) for i in range(50)])
     regime = rsi_oversold(prices, threshold=30)
     assert regime[-1] == 1
+
+
+def test_rsi_warmup_is_neutral():
+    # No RSI is defined until `period` deltas have been seen
+    prices = np.array([100 * (1.1**i) for i in range(50)])
+    assert np.all(rsi_overbought(prices, period=14)[:14] == 0)
+    assert np.all(rsi_oversold(prices, period=14)[:14] == 0)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        sma_crossover,
+        price_above_sma,
+        bollinger_squeeze,
+        atr_expansion,
+        rsi_overbought,
+        rsi_oversold,
+    ],
+)
+def test_regime_is_uint8(func, sample_prices):
+    regime = func(sample_prices)
+    assert regime.dtype == np.uint8
+    assert len(regime) == len(sample_prices)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_fused_kernels_match_composition(seed):
+    rng = np.random.default_rng(seed)
+    prices = 100 * np.cumprod(1 + rng.normal(0, 0.02, 300))
+
+    fused = rsi_overbought_or_oversold(prices, {"threshold": 60}, {"period": 7})
+    expected = np.logical_or(
+        rsi_overbought(prices, threshold=60), rsi_oversold(prices, period=7)
+    )
+    np.testing.assert_array_equal(fused, expected)
+
+    fused = sma_crossover_and_rsi_oversold(prices, {"short_window": 5}, {"threshold": 45})
+    expected = np.logical_and(
+        sma_crossover(prices, short_window=5), rsi_oversold(prices, threshold=45)
+    )
+    np.testing.assert_array_equal(fused, expected)
+
+
+def test_fused_kernels_reject_unknown_args(sample_prices):
+    with pytest.raises(TypeError):
+        rsi_overbought_or_oversold(sample_prices, {"window": 5}, {})
+
+
+def test_trend_warmup_is_zero(sample_prices):
+    # No signal until the moving averages are defined
+    assert np.all(sma_crossover(sample_prices, short_window=10, long_window=20)[:19] == 0)
+    assert np.all(price_above_sma(sample_prices, window=30)[:29] == 0)
+    assert np.all(price_above_sma(sample_prices[:10], window=30) == 0)
+
+
+@pytest.mark.parametrize("window", [2, 5, 20])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_rolling_mean_std_matches_reference(window, seed):
+    rng = np.random.default_rng(seed)
+    x = 100 * np.cumprod(1 + rng.normal(0, 0.02, 150))
+    windows = np.lib.stride_tricks.sliding_window_view(x, window)
+
+    mean, std = rolling_mean_std(x, window)
+    np.testing.assert_allclose(mean, windows.mean(axis=1), rtol=1e-12)
+    np.testing.assert_allclose(std, windows.std(axis=1, ddof=1), rtol=1e-9, atol=1e-9)
+
+
+def test_rolling_mean_std_constant_series():
+    mean, std = rolling_mean_std(np.full(50, 123.4), 10)
+    np.testing.assert_array_equal(mean, 123.4)
+    np.testing.assert_array_equal(std, 0.0)
+
+    # Constant tail after a jump: variance cancels to (near) zero, never negative
+    x = np.concatenate([np.full(10, 1.0), np.full(40, 1e4)])
+    _, std = rolling_mean_std(x, 10)
+    assert np.all(std >= 0)
+    np.testing.assert_allclose(std[10:], 0.0, atol=1e-6)
+
+
+def test_rolling_mean_std_masks_non_finite_windows():
+    x = np.arange(30, dtype=float)
+    x[0] = np.inf
+    x[12] = np.nan
+    mean, std = rolling_mean_std(x, 5)
+
+    # Only the windows spanning x[0] or x[12] are undefined
+    invalid = np.zeros(26, dtype=bool)
+    invalid[:1] = invalid[8:13] = True
+    assert np.array_equal(np.isnan(std), invalid)
+    assert np.array_equal(np.isnan(mean), invalid)
+    np.testing.assert_allclose(std[~invalid], np.std(np.arange(5), ddof=1))
+
+
+@pytest.mark.parametrize("centred", [False, True])
+def test_atr_expansion_with_zero_price_matches_pandas(centred):
+    pd = pytest.importorskip("pandas")
+
+    # A synthetic spread: hits zero once, and (when centred) crosses it
+    rng = np.random.default_rng(1)
+    prices = np.cumsum(rng.normal(0, 1, 300))
+    prices[100] = 0.0
+    if centred:
+        prices -= prices.mean()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        volatility = pd.Series(prices).pct_change().rolling(window=14).std()
+        volatility_sma = volatility.rolling(window=28).mean()
+        expected = (volatility.fillna(0) > volatility_sma.fillna(0)).to_numpy()
+
+    np.testing.assert_array_equal(atr_expansion(prices), expected)
+    assert atr_expansion(prices)[200:].any()
+
+
+def test_rolling_mean_std_long_drifting_series():
+    # Drifts far from x[0]: a single shift would lose most of the precision
+    rng = np.random.default_rng(0)
+    x = 100 * np.cumprod(1 + rng.normal(0, 0.02, 200_000))
+    windows = np.lib.stride_tricks.sliding_window_view(x, 20)
+
+    mean, std = rolling_mean_std(x, 20)
+    np.testing.assert_allclose(mean, windows.mean(axis=1), rtol=1e-10)
+    np.testing.assert_allclose(std, windows.std(axis=1, ddof=1), rtol=1e-7)
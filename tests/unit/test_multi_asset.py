@@ -1,50 +1,74 @@
+import functools
+
 import numpy as np
 import pytest
 
 from src.orchestrator.engine import Orchestrator
-from src.router.interface import ExecutionBlueprint, FunctionCall, SemanticRouter
+from src.router.interface import (
+    ExecutionBlueprint,
+    FunctionCall,
+    Kernel,
+    SemanticRouter,
+)
+
+
+# Built once and shared by every call; tests must not mutate them
+_SYNTH_BP = ExecutionBlueprint(
+    steps=[FunctionCall(function_id=Kernel.PRICE_ABOVE_SMA, args={"window": 10})],
+    composition="AND",
+    assets=["A-B"],
+)
+_BREADTH_BP = ExecutionBlueprint(
+    steps=[FunctionCall(function_id=Kernel.PRICE_ABOVE_SMA, args={"window": 10})],
+    composition="SUM",
+    assets=["A", "B", "C"],
+)
+_EMPTY_BP = ExecutionBlueprint(steps=[], composition="AND", assets=[])
+
+
+# Keyword -> prebuilt blueprint, dispatched by a hash lookup per query token
+_BLUEPRINTS = {"synthetic": _SYNTH_BP, "breadth": _BREADTH_BP}
+
+
+@functools.lru_cache(maxsize=128)
+def _parse(query: str) -> ExecutionBlueprint:
+    # Pure in the query and the blueprints are shared, so memoise
+    for token in query.split():
+        blueprint = _BLUEPRINTS.get(token)
+        if blueprint is not None:
+            return blueprint
+    return _EMPTY_BP
 
 
 class MockRouter(SemanticRouter):
     def parse_intent(self, query: str) -> ExecutionBlueprint:
-        if "synthetic" in query:
-            return ExecutionBlueprint(
-                steps=[
-                    FunctionCall(function_name="price_above_sma", args={"window": 10})
-                ],
-                composition="AND",
-                assets=["A-B"],
-            )
-        elif "breadth" in query:
-            return ExecutionBlueprint(
-                steps=[
-                    FunctionCall(function_name="price_above_sma", args={"window": 10})
-                ],
-                composition="SUM",
-                assets=["A", "B", "C"],
-            )
-        return ExecutionBlueprint(steps=[], composition="AND", assets=[])
-
-
-def test_synthetic_execution():
-    router = MockRouter()
-    orchestrator = Orchestrator(router)
-    # The data loader is mock, so A-B should just work as random-random
-    result = orchestrator.execute("Show me synthetic A-B")
-    assert "provenance" in result
-    assert result["provenance"].endswith("(Multi-Asset)")
-    assert len(result["regime"]) == 100
-
-
-def test_breadth_execution():
-    router = MockRouter()
-    orchestrator = Orchestrator(router)
-    # 3 assets, SUM composition.
-    # Mock data loader returns random walks.
-    # price_above_sma returns 0 or 1.
-    # Sum should be between 0 and 3.
-    result = orchestrator.execute("Show me breadth")
-    regime = np.array(result["regime"])
-    assert len(regime) == 100
-    assert np.all(regime >= 0)
-    assert np.all(regime <= 3)
+        return _parse(query)
+
+
+@pytest.fixture(scope="module")
+def orch():
+    # One router/orchestrator pair shared by every test in this module
+    return Orchestrator(MockRouter())
+
+
+@pytest.mark.parametrize(
+    "query,check",
+    [
+        # The data loader is mock, so A-B should just work as random-random
+        ("Show me synthetic A-B", lambda r: r["provenance"].endswith("(Multi-Asset)")),
+        # 3 assets, SUM composition of 0/1 price_above_sma regimes: 0..3
+        (
+            "Show me breadth",
+            lambda r: r["regime"].min() >= 0 and r["regime"].max() <= 3,
+        ),
+    ],
+    ids=["synthetic", "breadth"],
+)
+def test_execute(orch, query, check):
+    # Independent cases, so they can be spread across workers (pytest -n auto)
+    result = orch.execute(query)
+    # Regimes come back as ndarrays, not lists
+    assert isinstance(result["regime"], np.ndarray)
+    assert result["regime"].shape[0] == 100
+    assert check(result)
+
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from src.utils.smoothing import smooth_regime
+
+
+def _reference_smooth(regime, window=3):
+    # The original per-element loop
+    if len(regime) < window:
+        return regime
+
+    result = np.copy(regime)
+    for i in range(len(regime)):
+        start = max(0, i - window // 2)
+        end = min(len(regime), i + window // 2 + 1)
+        result[i] = np.sum(regime[start:end]) > (end - start) / 2
+    return result
+
+
+@pytest.mark.parametrize("window", range(1, 8))
+@pytest.mark.parametrize("n", [0, 1, 2, 5, 6, 7, 100])
+@pytest.mark.parametrize("kind", ["binary", "sum", "average"])
+def test_smooth_regime_matches_reference(window, n, kind):
+    rng = np.random.default_rng(window * 1000 + n)
+    if kind == "binary":
+        regime = rng.integers(0, 2, n).astype(np.uint8)
+    elif kind == "sum":
+        # Cross-sectional breadth count over 3 assets
+        regime = rng.integers(0, 4, n)
+    else:
+        # AVERAGE of two binary steps
+        regime = rng.integers(0, 3, n) / 2
+
+    np.testing.assert_array_equal(
+        smooth_regime(regime, window), _reference_smooth(regime, window)
+    )
+
+
+@pytest.mark.parametrize(
+    "n,dtype", [(2, np.uint8), (100, np.uint8), (100, np.int64)]
+)
+def test_smooth_regime_out_buffer(n, dtype):
+    regime = np.random.default_rng(n).integers(0, 2, n).astype(dtype)
+    buf = np.empty(n, dtype=np.uint8)
+
+    result = smooth_regime(regime, out=buf)
+    assert result is buf
+    np.testing.assert_array_equal(result, smooth_regime(regime))
+
+
+def test_smooth_regime_short_non_binary_ignores_out():
+    # Too short to smooth: an AVERAGE regime must come back intact, not truncated
+    regime = np.array([0.5, 1.0])
+    buf = np.empty(2, dtype=np.uint8)
+
+    result = smooth_regime(regime, out=buf)
+    assert result is regime
+    np.testing.assert_array_equal(result, [0.5, 1.0])
@@ -0,0 +1,19 @@
+import numpy as np
+
+from src.orchestrator.stability import calculate_hamming_distance, pack_bits
+
+
+def test_packed_hamming_matches_unpacked():
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, 2, 130).astype(np.uint8)
+    b = rng.integers(0, 2, 130).astype(np.uint8)
+
+    expected = calculate_hamming_distance(a, b)
+    assert calculate_hamming_distance(pack_bits(a), pack_bits(b)) == expected
+    assert calculate_hamming_distance(pack_bits(a), pack_bits(a)) == 0
+
+    scratch = np.empty(len(a), dtype=np.uint8)
+    assert calculate_hamming_distance(a, b, out=scratch) == expected
+    words = pack_bits(a)
+    scratch = np.empty_like(words)
+    assert calculate_hamming_distance(words, pack_bits(b), out=scratch) == expected